@@ -4,6 +4,7 @@ text_string_tools_customtk_all_formats.py
 CustomTkinter GUI app with:
   1) Word Frequency (multi-format file browser):
        - Supports: .txt, .md, .log, .csv, .html, .htm, .docx, .pdf, .pptx
+       - Optionally .rtf, .odt, .odp, .epub, .doc, .ppt via Apache Tika
        - Ignores images and image-only content (scanned PDFs will appear empty)
        - Aligned "word.............count" output with monospace font
   2) Palindrome Checker
@@ -13,47 +14,206 @@ Features:
   - Dark / Light / System appearance switch
 """
 
+import functools
+import hashlib
+import importlib.util
+import io
+import json
 import os
+import queue
 import re
 import string
+import threading
 from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator
 
 import customtkinter as ctk
 from tkinter import messagebox, filedialog
 
-# External libraries for document formats
-import docx           # python-docx
-import PyPDF2         # PyPDF2
-from pptx import Presentation  # python-pptx
+# Document libraries (python-docx, PyPDF2, python-pptx, and the optional
+# PyMuPDF / pypdfium2 / lxml) are imported inside their extractors, so the
+# app starts without paying for formats that are never opened.
+
+# Optional acceleration for the Caesar cipher on ASCII text: Numba kernel if
+# available, else NumPy vectorization, else a plain loop. Both are imported
+# on first use; find_spec only checks that NumPy is installed.
+_HAVE_NUMPY = importlib.util.find_spec("numpy") is not None
+
+# precompiled once at import instead of on every call
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+# a word is a run of characters that are neither whitespace nor ASCII punctuation
+_WORD_RE = re.compile(r"[^\s" + re.escape(string.punctuation) + r"]+")
+
+# byte tables for the ASCII palindrome fast path
+_ASCII_LOWER = bytes.maketrans(string.ascii_uppercase.encode(),
+                               string.ascii_lowercase.encode())
+_ASCII_NON_ALNUM = bytes(c for c in range(128) if not chr(c).isalnum())
+# character pairs compared one by one before switching to the byte tables
+_PALINDROME_PROBE_PAIRS = 8
+
+# the Word Frequency report lists at most this many of the most common words
+TOP_K_DISPLAY = 5000
+
+# below this length the plain Caesar loop beats NumPy's per-call overhead
+_CAESAR_NUMPY_MIN_LEN = 1024
+
+# PDFs up to this size are read into memory whole for PyPDF2
+_PDF_IN_MEMORY_MAX_BYTES = 64 << 20
+
+# how often (ms) the UI checks whether a file analysis has finished
+_WF_POLL_MS = 50
 
 
 # ---------------- LOGIC FUNCTIONS ---------------- #
 
-def normalize_text_for_words(text: str) -> str:
-    """Lowercase and replace punctuation with spaces."""
-    trans_table = str.maketrans(string.punctuation, " " * len(string.punctuation))
-    return text.translate(trans_table).lower()
+def update_word_frequency(counter: Counter, text: str) -> None:
+    """Add the word frequencies of a chunk of raw text to an existing Counter."""
+    # findall builds the token list in C and each token is lowercased on its
+    # own (lowercasing the whole chunk would apply Greek final-sigma rules
+    # across punctuation); Counter.update then runs CPython's C counting loop
+    counter.update(map(str.lower, _WORD_RE.findall(text)))
 
 
 def compute_word_frequency_from_text(text: str) -> Counter:
     """Return a Counter mapping words to frequencies from raw text."""
-    normalized = normalize_text_for_words(text)
-    words = normalized.split()
-    return Counter(words)
+    counter = Counter()
+    update_word_frequency(counter, text)
+    return counter
+
+
+def format_word_frequency_report(path: str, counter: Counter) -> str:
+    """Build the aligned "word.....count" report shown in the Word Frequency tab."""
+    # pretty aligned output with dots: word.....count
+    max_word_len = max(map(len, counter), default=0)
+
+    # where count column starts (in characters)
+    count_column = max_word_len + 30  # tweak for more/less dots
+
+    lines = []
+    lines.append(f"Word frequency for file: {path}")
+    lines.append("")
+
+    # one run of dots, sliced per row so each word's count starts at count_column
+    # (count_column leaves at least 29 dots after the longest word)
+    dots = "." * count_column
+    # most_common(k) is a heap selection, not a full sort of every word
+    lines.extend([
+        f"{word} {dots[len(word) + 1:]} {count}"
+        for word, count in counter.most_common(TOP_K_DISPLAY)
+    ])
+    if len(counter) > TOP_K_DISPLAY:
+        lines.append("")
+        lines.append(f"(showing top {TOP_K_DISPLAY} of {len(counter)} unique words)")
+
+    return "\n".join(lines)
 
 
 def is_palindrome_core(s: str) -> bool:
     """Check if string is palindrome ignoring non-alnum and case."""
-    cleaned_chars = []
-    for ch in s:
-        if ch.isalnum():
-            cleaned_chars.append(ch.lower())
-    cleaned = "".join(cleaned_chars)
+    # walk inwards from both ends comparing pairs case-insensitively; most
+    # non-palindromes fail within a few pairs, before anything is copied
+    i, j = 0, len(s) - 1
+    pairs = 0
+    while i < j and pairs < _PALINDROME_PROBE_PAIRS:
+        while i < j and not s[i].isalnum():
+            i += 1
+        while i < j and not s[j].isalnum():
+            j -= 1
+        a, b = s[i].lower(), s[j].lower()
+        if len(a) != 1 or len(b) != 1:
+            break  # lowercase expands (e.g. "İ"); leave it to the exact check below
+        if a != b:
+            return False
+        i += 1
+        j -= 1
+        pairs += 1
+
+    middle = s[i:j + 1]
+    if middle.isascii():
+        # lowercase and drop non-alnum bytes in one C-level translate pass
+        cleaned = middle.encode("ascii").translate(_ASCII_LOWER, _ASCII_NON_ALNUM)
+        return cleaned == cleaned[::-1]
+
+    # lowercase per character, never the whole string: str.lower() applies
+    # context rules (Greek final sigma) that would break e.g. "ΣΑΣ"
+    cleaned = "".join([ch.lower() for ch in middle if ch.isalnum()])
     return cleaned == cleaned[::-1]
 
 
+@functools.lru_cache(maxsize=None)
+def _get_caesar_kernel():
+    """Return the Numba Caesar kernel, importing Numba on first use, or None."""
+    try:
+        import numpy as np
+        from numba import njit
+    except ImportError:
+        return None
+
+    # SWAR constants: one value repeated in each byte lane of a uint64
+    lanes_01 = np.uint64(0x0101010101010101)
+    lanes_80 = np.uint64(0x8080808080808080)
+
+    def caesar_kernel(buf, shift):
+        # in-place shift of ASCII letters in a uint8 buffer; 0 <= shift < 26
+        n_swar = buf.size - buf.size % 8
+        words = buf[:n_swar].view(np.uint64)
+        k = np.uint64(shift)
+        seven = np.uint64(7)
+
+        # 8 characters per step; every byte is < 0x80, so the lane sums
+        # below stay under 0x100 and never carry into the next lane
+        for i in range(words.size):
+            w = words[i]
+            lo = w | (lanes_01 * np.uint64(0x20))
+            # 1 in each lane where 'a' <= lo <= 'z'
+            is_alpha = (((lo + lanes_01 * np.uint64(0x80 - 0x61))
+                         & ~(lo + lanes_01 * np.uint64(0x80 - 0x7B)))
+                        & lanes_80) >> seven
+            step = is_alpha * k
+            # 1 in each letter lane that runs past 'z' and must wrap
+            wraps = (((lo + step + lanes_01 * np.uint64(0x80 - 0x7B))
+                      & lanes_80) >> seven) & is_alpha
+            words[i] = w + step - wraps * np.uint64(26)
+
+        # scalar tail
+        for i in range(n_swar, buf.size):
+            c = buf[i]
+            lower = c | 0x20
+            if lower >= 97 and lower <= 122:
+                base = 65 + (c & 0x20)
+                buf[i] = (c - base + shift) % 26 + base
+
+    return njit(cache=True)(caesar_kernel)
+
+
+def _caesar_transform_numpy(text: str, shift: int) -> str:
+    # vectorized form of the loop below for ASCII text; 0 <= shift < 26
+    import numpy as np
+
+    arr = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    lower = arr | 0x20
+    is_alpha = (lower >= 97) & (lower <= 122)
+    base = (arr & 0x20) + 65
+    # uint8 wraparound on non-letters is harmless: np.where discards them
+    shifted = (arr - base + shift) % 26 + base
+    return np.where(is_alpha, shifted, arr).tobytes().decode("ascii")
+
+
 def caesar_transform(text: str, shift: int) -> str:
     """Apply Caesar shift to letters, preserving case and non-letters."""
+    if text.isascii():
+        kernel = _get_caesar_kernel()
+        if kernel is not None:
+            import numpy as np
+
+            buf = np.frombuffer(text.encode("ascii"), dtype=np.uint8).copy()
+            kernel(buf, shift % 26)
+            return buf.tobytes().decode("ascii")
+        if _HAVE_NUMPY and len(text) >= _CAESAR_NUMPY_MIN_LEN:
+            return _caesar_transform_numpy(text, shift % 26)
+
     result_chars = []
     for ch in text:
         if ch.isalpha():
@@ -69,67 +229,247 @@ def caesar_transform(text: str, shift: int) -> str:
 
 
 # ---------------- FILE TEXT EXTRACTION ---------------- #
+#
+# Extractors are generators yielding text chunks (lines, paragraphs, pages,
+# shapes) so large documents can be counted without holding all their text.
 
-def extract_text_from_txt_like(path: str) -> str:
+def extract_text_from_txt_like(path: str) -> Iterator[str]:
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        return f.read()
+        yield from f
 
 
-def extract_text_from_html(path: str) -> str:
-    # basic: strip HTML tags, including <img> etc.
+def extract_text_from_html(path: str) -> Iterator[str]:
+    """Yield the text nodes of an HTML file; scripts, styles and comments are dropped."""
     with open(path, "r", encoding="utf-8", errors="ignore") as f:
         html = f.read()
-    # remove tags
-    text = re.sub(r"<[^>]+>", " ", html)
-    return text
 
+    try:
+        from lxml import etree
+        from lxml import html as lxml_html
+    except ImportError:
+        lxml_html = None  # optional C parser; fall back to the regex below
+
+    if lxml_html is not None:
+        try:
+            root = lxml_html.document_fromstring(html)
+        except (etree.LxmlError, ValueError):
+            root = None  # empty or unparseable; use the regex below
+        if root is not None:
+            etree.strip_elements(root, "script", "style", etree.Comment,
+                                 etree.ProcessingInstruction, with_tail=False)
+            yield from root.itertext()
+            return
+
+    # basic: strip HTML tags, including <img> etc.
+    yield _HTML_TAG_RE.sub(" ", html)
+
+
+def extract_text_from_docx(path: str) -> Iterator[str]:
+    import docx  # python-docx
 
-def extract_text_from_docx(path: str) -> str:
     d = docx.Document(path)
-    parts = []
     for para in d.paragraphs:
         if para.text:
-            parts.append(para.text)
-    return "\n".join(parts)
+            yield para.text
+
+
+def extract_text_from_pdf(path: str) -> Iterator[str]:
+    """
+    Yield text page by page from a PDF; images are ignored by default.
+
+    Uses PyMuPDF if installed, then pypdfium2, then PyPDF2. Password-protected
+    files always go through PyPDF2.
+    """
+    backend = _pdf_backend()
+    if backend == "pymupdf":
+        return _extract_text_from_pdf_mupdf(path)
+    if backend == "pdfium":
+        return _extract_text_from_pdf_pdfium(path)
+    return _extract_text_from_pdf_pypdf2(path)
+
+
+@functools.lru_cache(maxsize=None)
+def _pdf_backend() -> str:
+    """Return the fastest installed PDF backend, importing it on first use."""
+    try:
+        import pymupdf  # noqa: F401  PyMuPDF
+        return "pymupdf"
+    except ImportError:
+        pass
+    try:
+        import pypdfium2  # noqa: F401
+        return "pdfium"
+    except ImportError:
+        return "pypdf2"
+
+
+def _extract_text_from_pdf_mupdf(path: str) -> Iterator[str]:
+    import pymupdf
+
+    with pymupdf.open(path) as doc:
+        if doc.needs_pass:
+            yield from _extract_text_from_pdf_pypdf2(path)
+            return
+        for page in doc:
+            page_text = page.get_text("text")
+            if page_text:
+                yield page_text
+
+
+def _extract_text_from_pdf_pdfium(path: str) -> Iterator[str]:
+    import pypdfium2 as pdfium
+
+    try:
+        pdf = pdfium.PdfDocument(path)
+    except pdfium.PdfiumError:
+        yield from _extract_text_from_pdf_pypdf2(path)
+        return
+
+    try:
+        for page in pdf:
+            textpage = page.get_textpage()
+            try:
+                page_text = textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+            if page_text:
+                yield page_text
+    finally:
+        pdf.close()
 
 
-def extract_text_from_pdf(path: str) -> str:
-    """Extract text from a PDF using PyPDF2; images are ignored by default."""
-    text_parts = []
-    with open(path, "rb") as f:
+def _open_pdf_stream(path: str):
+    """Open path as an in-memory stream if small enough, else with a large buffer."""
+    # PyPDF2 does many small seeks/reads; serve them from memory, not syscalls
+    if os.path.getsize(path) <= _PDF_IN_MEMORY_MAX_BYTES:
+        return io.BytesIO(Path(path).read_bytes())
+    return open(path, "rb", buffering=1 << 20)
+
+
+def _extract_text_from_pdf_pypdf2(path: str) -> Iterator[str]:
+    import PyPDF2  # always-available fallback
+
+    with _open_pdf_stream(path) as f:
         reader = PyPDF2.PdfReader(f)
         for page in reader.pages:
             page_text = page.extract_text()
             if page_text:
-                text_parts.append(page_text)
-    return "\n".join(text_parts)
+                yield page_text
+
 
+def extract_text_from_pptx(path: str) -> Iterator[str]:
+    """Yield text shape by shape from PowerPoint; ignores images."""
+    from pptx import Presentation  # python-pptx
 
-def extract_text_from_pptx(path: str) -> str:
-    """Extract text from PowerPoint; ignores images."""
     prs = Presentation(path)
-    parts = []
     for slide in prs.slides:
         for shape in slide.shapes:
-            if hasattr(shape, "text"):
-                if shape.text:
-                    parts.append(shape.text)
-            elif hasattr(shape, "text_frame"):
-                # older style but generally covered by shape.text
-                if shape.text_frame is not None:
-                    for para in shape.text_frame.paragraphs:
-                        run_texts = []
-                        for run in para.runs:
-                            run_texts.append(run.text)
-                        para_text = "".join(run_texts)
-                        if para_text:
-                            parts.append(para_text)
-    return "\n".join(parts)
+            # text_frame.text joins paragraphs and runs in one call
+            if shape.has_text_frame:
+                shape_text = shape.text_frame.text
+                if shape_text:
+                    yield shape_text
 
 
-def extract_text_generic(path: str) -> str:
+def extract_text_with_tika(path: str) -> Iterator[str]:
+    """Yield text from formats without a native extractor via Apache Tika."""
+    from tika import parser as tika_parser  # optional; needs a Java runtime
+
+    parsed = tika_parser.from_file(path)
+    if parsed.get("content"):
+        yield parsed["content"]
+
+
+# ---------------- WORD COUNT CACHE ---------------- #
+#
+# Word counts are memoized on disk, keyed by the file's absolute path, mtime
+# and size plus the extractor backend, so re-analyzing an unchanged document
+# skips the parsers and the counting entirely. Extracted text is not stored.
+
+_CACHE_DIR = Path.home() / ".cache" / "jackfruit"
+# bump whenever extractor or tokenizer output changes so stale entries are ignored
+_CACHE_VERSION = 2
+# least recently used entries beyond this count are deleted after each save
+_CACHE_MAX_ENTRIES = 200
+
+# formats handed to Apache Tika when it is installed (the JVM start-up makes
+# it far slower than the native extractors, so it is only a fallback)
+_TIKA_EXTS = (".rtf", ".odt", ".odp", ".epub", ".doc", ".ppt")
+
+
+def _extractor_variant(path: str) -> str:
+    """Name the backend that extracts path, so switching backends misses the cache."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".pdf":
+        return _pdf_backend()
+    if ext in (".html", ".htm"):
+        return "lxml" if importlib.util.find_spec("lxml") is not None else "regex"
+    return ""
+
+
+def _cache_digest(path: str):
+    """Return the cache key for the current version of path, or None."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key = (f"{_CACHE_VERSION}|{_extractor_variant(path)}|{os.path.abspath(path)}"
+           f"|{st.st_mtime_ns}|{st.st_size}")
+    return hashlib.sha1(key.encode("utf-8", "surrogateescape")).hexdigest()
+
+
+def _publish_cache_file(tmp: Path, target: Path) -> None:
+    try:
+        os.replace(tmp, target)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+
+
+def load_cached_word_frequency(digest: str):
+    """Return the Counter cached under digest (from _cache_digest), or None."""
+    cache_file = _CACHE_DIR / "counts" / f"{digest}.json"
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            counter = Counter(json.load(f))
+        os.utime(cache_file)  # mark as recently used for _prune_cache
+    except (OSError, ValueError):
+        return None
+    return counter
+
+
+def save_cached_word_frequency(digest: str, counter: Counter) -> None:
+    """Store counter under digest (from _cache_digest)."""
+    cache_file = _CACHE_DIR / "counts" / f"{digest}.json"
+    tmp = cache_file.with_name(f"{cache_file.name}.{os.getpid()}.tmp")
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "w", encoding="utf-8") as f:
+            json.dump(counter, f, ensure_ascii=False)
+    except (OSError, UnicodeError):
+        tmp.unlink(missing_ok=True)
+        return
+    _publish_cache_file(tmp, cache_file)
+    _prune_cache(cache_file.parent)
+
+
+def _prune_cache(counts_dir: Path) -> None:
+    entries = []
+    for entry in counts_dir.glob("*.json"):
+        try:
+            entries.append((entry.stat().st_mtime_ns, entry))
+        except OSError:
+            pass  # removed by another instance meanwhile
+    if len(entries) <= _CACHE_MAX_ENTRIES:
+        return
+    entries.sort()
+    for _, entry in entries[:len(entries) - _CACHE_MAX_ENTRIES]:
+        entry.unlink(missing_ok=True)
+
+
+def iter_text_chunks(path: str) -> Iterator[str]:
     """
-    Extract text from various file types.
+    Return an iterator of text chunks extracted from various file types.
 
     Supported:
       - .txt, .md, .log, .csv
@@ -137,8 +477,10 @@ def extract_text_generic(path: str) -> str:
       - .docx
       - .pdf
       - .pptx
+      - .rtf, .odt, .odp, .epub, .doc, .ppt (only if the tika package is installed)
 
-    Image-only content (e.g., scanned PDFs) will result in empty text.
+    Image-only content (e.g., scanned PDFs) will yield no text.
+    Raises ValueError up front for unsupported file types.
     """
     _, ext = os.path.splitext(path)
     ext = ext.lower()
@@ -153,11 +495,18 @@ def extract_text_generic(path: str) -> str:
         return extract_text_from_pdf(path)
     if ext == ".pptx":
         return extract_text_from_pptx(path)
+    if ext in _TIKA_EXTS and importlib.util.find_spec("tika") is not None:
+        return extract_text_with_tika(path)
 
     # Unsupported or binary/image-only
     raise ValueError(f"Unsupported file type: {ext}")
 
 
+def extract_text_generic(path: str) -> str:
+    """Extract the full text of a supported file as one string."""
+    return "\n".join(iter_text_chunks(path))
+
+
 # ---------------- MAIN APP CLASS ---------------- #
 
 class TextToolsApp(ctk.CTk):
@@ -176,6 +525,21 @@ class TextToolsApp(ctk.CTk):
         # monospace font (used for text areas)
         self.mono_font = ("Consolas", 11)
 
+        # background worker for file analysis (keeps the UI responsive)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        # finished analyses are handed back through this queue and picked up
+        # by wf_poll_result on the Tk thread; the worker never touches Tk
+        self._wf_results = queue.Queue()
+        # set on close; the worker checks it between chunks and gives up
+        self._wf_cancel = threading.Event()
+        # import Numba and compile (or load from cache) the Caesar kernel
+        # before first use, on its own thread so it never delays the first
+        # file analysis or the window appearing
+        threading.Thread(
+            target=caesar_transform, args=("warm up", 1), daemon=True
+        ).start()
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
         # build UI
         self.create_top_bar()
         self.create_tabs()
@@ -208,6 +572,11 @@ class TextToolsApp(ctk.CTk):
     def change_appearance_mode(self, new_mode: str):
         ctk.set_appearance_mode(new_mode)
 
+    def on_close(self):
+        self._wf_cancel.set()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.destroy()
+
     # ---------------- TABS ---------------- #
 
     def create_tabs(self):
@@ -256,12 +625,12 @@ class TextToolsApp(ctk.CTk):
         button_row = ctk.CTkFrame(container)
         button_row.pack(fill="x", pady=(0, 8))
 
-        analyze_button = ctk.CTkButton(
+        self.wf_analyze_button = ctk.CTkButton(
             button_row,
             text="Analyze File",
             command=self.wf_analyze_file
         )
-        analyze_button.pack(side="left")
+        self.wf_analyze_button.pack(side="left")
 
         clear_button = ctk.CTkButton(
             button_row,
@@ -272,12 +641,16 @@ class TextToolsApp(ctk.CTk):
         )
         clear_button.pack(side="left", padx=(8, 0))
 
+        # progress text while a file is being analyzed
+        self.wf_status_label = ctk.CTkLabel(button_row, text="")
+        self.wf_status_label.pack(side="left", padx=(12, 0))
+
         # textbox for output
         self.wf_output = ctk.CTkTextbox(
             container,
             wrap="none"  # keep columns aligned horizontally
         )
-        self.wf_output.configure(font=self.mono_font)
+        self.wf_output.configure(font=self.mono_font, state="disabled")
         self.wf_output.pack(expand=True, fill="both", pady=(5, 0))
 
     def wf_browse_file(self):
@@ -288,6 +661,8 @@ class TextToolsApp(ctk.CTk):
                  "*.txt *.md *.log *.csv *.html *.htm *.docx *.pdf *.pptx"),
                 ("Text files", "*.txt *.md *.log *.csv"),
                 ("Documents", "*.docx *.pdf *.pptx"),
+                ("Other documents (needs Apache Tika)",
+                 "*.rtf *.odt *.odp *.epub *.doc *.ppt"),
                 ("HTML files", "*.html *.htm"),
                 ("All files", "*.*"),
             ]
@@ -301,8 +676,53 @@ class TextToolsApp(ctk.CTk):
             messagebox.showwarning("No file", "Please select a file using Browse.")
             return
 
+        # extraction + counting run on a worker thread so the UI stays live
+        self.wf_analyze_button.configure(state="disabled")
+        self.wf_status_label.configure(text=f"Analyzing {os.path.basename(path)}...")
+        future = self._executor.submit(self.wf_do_analyze, path)
+        future.add_done_callback(lambda f: self._wf_results.put((path, f)))
+        self.after(_WF_POLL_MS, self.wf_poll_result)
+
+    def wf_do_analyze(self, path: str):
+        """Worker-thread side: return (found_text, report or None)."""
+        # key the cache on the file as it was before extraction started
+        digest = _cache_digest(path)
+        if digest is not None:
+            counter = load_cached_word_frequency(digest)
+            if counter:
+                return True, format_word_frequency_report(path, counter)
+
+        counter = Counter()
+        found_text = False
+        for chunk in iter_text_chunks(path):
+            if self._wf_cancel.is_set():
+                return found_text, None  # window closed; drop the partial counts
+            if not found_text and chunk and not chunk.isspace():
+                found_text = True
+            update_word_frequency(counter, chunk)
+        # skip the save if the file changed while it was being read, so the
+        # counts are never stored under a key for content they don't match
+        if counter and digest is not None and _cache_digest(path) == digest:
+            save_cached_word_frequency(digest, counter)
+
+        if not counter:
+            return found_text, None
+        return found_text, format_word_frequency_report(path, counter)
+
+    def wf_poll_result(self):
+        try:
+            path, future = self._wf_results.get_nowait()
+        except queue.Empty:
+            self.after(_WF_POLL_MS, self.wf_poll_result)
+            return
+        self.wf_render_result(path, future)
+
+    def wf_render_result(self, path: str, future):
+        self.wf_analyze_button.configure(state="normal")
+        self.wf_status_label.configure(text="")
+
         try:
-            raw_text = extract_text_generic(path)
+            found_text, report = future.result()
         except ValueError as ve:
             messagebox.showerror("Unsupported file", str(ve))
             return
@@ -310,48 +730,32 @@ class TextToolsApp(ctk.CTk):
             messagebox.showerror("File error", f"Could not open or parse file:\n{e}")
             return
 
-        if raw_text.strip() == "":
+        if not found_text:
             messagebox.showwarning(
                 "No text found",
                 "No extractable text was found.\n"
                 "If this is a scanned PDF or image-only document, it cannot be analyzed."
             )
-            self.wf_output.delete("1.0", "end")
-            self.wf_output.insert("end", "No text found in document.\n")
+            self.wf_set_output("No text found in document.\n")
             return
 
-        counter = compute_word_frequency_from_text(raw_text)
-        if not counter:
-            self.wf_output.delete("1.0", "end")
-            self.wf_output.insert("end", "No words found after processing.\n")
+        if report is None:
+            self.wf_set_output("No words found after processing.\n")
             return
 
-        # pretty aligned output with dots: word.....count
-        max_word_len = 0
-        for word in counter.keys():
-            if len(word) > max_word_len:
-                max_word_len = len(word)
-
-        # where count column starts (in characters)
-        count_column = max_word_len + 30  # tweak for more/less dots
-
-        lines = []
-        lines.append(f"Word frequency for file: {path}")
-        lines.append("")
-
-        for word, count in counter.most_common():
-            dots_needed = count_column - len(word) - 1  # 1 space after word
-            if dots_needed < 1:
-                dots_needed = 1
-            dots = "." * dots_needed
-            line = f"{word} {dots} {count}"
-            lines.append(line)
+        self.wf_set_output(report)
 
+    def wf_set_output(self, text: str):
+        # the textbox is read-only; unlock it for a single delete + insert so
+        # Tk re-lays out the content once, then scroll back to the top
+        self.wf_output.configure(state="normal")
         self.wf_output.delete("1.0", "end")
-        self.wf_output.insert("end", "\n".join(lines))
+        self.wf_output.insert("end", text)
+        self.wf_output.configure(state="disabled")
+        self.wf_output.see("1.0")
 
     def wf_clear_output(self):
-        self.wf_output.delete("1.0", "end")
+        self.wf_set_output("")
         self.wf_file_path_var.set("")
 
     # ---------------- PALINDROME TAB ---------------- #